@@ -24,7 +24,7 @@ def get_stock_price(symbol: str):
         stock = yf.Ticker(symbol)
         historical_data = stock.history(period="1d")
         if not historical_data.empty:
-            current_price = historical_data['Close'].iloc[-1]
+            current_price = historical_data['Close'].iat[-1]
             return current_price
         else:
             return None